@@ -18,9 +18,19 @@ from urllib import request as _urllib_request, error as _urllib_error
 sys.path.insert(0, '/app/runner-shell')
 
 from runner_shell.core.shell import RunnerShell
-from runner_shell.core.protocol import MessageType, SessionStatus, PartialInfo
+from runner_shell.core.protocol import MessageType, PartialInfo
 from runner_shell.core.context import RunnerContext
 
+# AgenticSession routes on the backend. The *_API_* variants are relative to the
+# API root, for use with BACKEND_API_URL which already ends in /api.
+_AGENTIC_SESSION_API_PATH_FMT = "/projects/{project}/agentic-sessions/{session}"
+_AGENTIC_SESSION_STATUS_API_PATH_FMT = _AGENTIC_SESSION_API_PATH_FMT + "/status"
+_AGENTIC_SESSION_PATH_FMT = "/api" + _AGENTIC_SESSION_API_PATH_FMT
+_AGENTIC_SESSION_STATUS_PATH_FMT = "/api" + _AGENTIC_SESSION_STATUS_API_PATH_FMT
+
+# Cap concurrent runner -> backend API requests so bursts don't exhaust executor threads
+_BACKEND_REQUEST_SEMAPHORE = asyncio.Semaphore(5)
+
 
 class ClaudeCodeAdapter:
     """Adapter that wraps the existing Claude Code CLI for runner-shell."""
@@ -30,6 +40,7 @@ class ClaudeCodeAdapter:
         self.shell = None
         self.claude_process = None
         self._incoming_queue: "asyncio.Queue[dict]" = asyncio.Queue()
+        self._status_url_cache: tuple[str | None, str] | None = None
 
     async def initialize(self, context: RunnerContext):
         """Initialize the adapter with context."""
@@ -816,16 +827,16 @@ class ClaudeCodeAdapter:
         def _do_req():
             try:
                 with _urllib_request.urlopen(req, timeout=15) as resp:
-                    return resp.read().decode("utf-8", errors="replace")
+                    return resp.read()
             except _urllib_error.HTTPError as he:
                 err_body = he.read().decode("utf-8", errors="replace")
                 raise RuntimeError(f"GitHub PR create failed: HTTP {he.code}: {err_body}")
             except Exception as e:
                 raise RuntimeError(str(e))
 
-        resp_text = await loop.run_in_executor(None, _do_req)
+        resp_body = await loop.run_in_executor(None, _do_req)
         try:
-            pr = _json.loads(resp_text)
+            pr = _json.loads(resp_body)
             return pr.get("html_url") or None
         except Exception:
             return None
@@ -874,6 +885,20 @@ class ClaudeCodeAdapter:
             return ""
 
     def _compute_status_url(self) -> str | None:
+        """Return the CR status endpoint, cached per WS URL.
+
+        Every backend call derives its URL from this, so the parse is done
+        once and only repeated if the shell's WS URL changes.
+        """
+        ws_url = getattr(getattr(self.shell, 'transport', None), 'url', None)
+        if self._status_url_cache and self._status_url_cache[0] == ws_url:
+            return self._status_url_cache[1]
+        status_url = self._derive_status_url()
+        if status_url:
+            self._status_url_cache = (ws_url, status_url)
+        return status_url
+
+    def _derive_status_url(self) -> str | None:
         """Compute CR status endpoint from WS URL or env.
 
         Expected WS path: /api/projects/{project}/sessions/{session}/ws
@@ -892,13 +917,13 @@ class ClaudeCodeAdapter:
                     si = parts.index('sessions')
                     project = parts[pi+1] if len(parts) > pi+1 else os.getenv('PROJECT_NAME', '')
                     sess = parts[si+1] if len(parts) > si+1 else session_id
-                    path = f"/api/projects/{project}/agentic-sessions/{sess}/status"
+                    path = _AGENTIC_SESSION_STATUS_PATH_FMT.format(project=project, session=sess)
                     return urlunparse((scheme, parsed.netloc, path, '', '', ''))
             # Fallback to BACKEND_API_URL and PROJECT_NAME
             base = os.getenv('BACKEND_API_URL', '').rstrip('/')
             project = os.getenv('PROJECT_NAME', '').strip()
             if base and project and session_id:
-                return f"{base}/projects/{project}/agentic-sessions/{session_id}/status"
+                return base + _AGENTIC_SESSION_STATUS_API_PATH_FMT.format(project=project, session=session_id)
         except Exception:
             return None
         return None
@@ -911,13 +936,12 @@ class ClaudeCodeAdapter:
         
         # Transform status URL to patch endpoint
         try:
-            from urllib.parse import urlparse as _up, urlunparse as _uu
-            p = _up(status_url)
+            p = urlparse(status_url)
             # Remove /status suffix to get base resource URL
             new_path = p.path.rstrip("/")
             if new_path.endswith("/status"):
                 new_path = new_path[:-7]
-            url = _uu((p.scheme, p.netloc, new_path, '', '', ''))
+            url = urlunparse((p.scheme, p.netloc, new_path, '', '', ''))
             
             # JSON merge patch to update annotations
             patch = _json.dumps({
@@ -947,7 +971,8 @@ class ClaudeCodeAdapter:
                     logging.error(f"Annotation update failed: {e}")
                     return False
             
-            await loop.run_in_executor(None, _do)
+            async with _BACKEND_REQUEST_SEMAPHORE:
+                await loop.run_in_executor(None, _do)
         except Exception as e:
             logging.error(f"Failed to update annotation: {e}")
     
@@ -976,15 +1001,17 @@ class ClaudeCodeAdapter:
                 logging.error(f"CR status update failed: {e}")
                 return False
 
+        loop = asyncio.get_event_loop()
         if blocking:
-            # Synchronous blocking call - ensures completion before container exit
+            # Awaited to completion before container exit, but off the event loop thread
             logging.info(f"BLOCKING CR status update to {fields.get('phase', 'unknown')}")
-            success = _do()
+            async with _BACKEND_REQUEST_SEMAPHORE:
+                success = await loop.run_in_executor(None, _do)
             logging.info(f"BLOCKING update {'succeeded' if success else 'failed'}")
         else:
             # Async call for non-critical updates
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, _do)
+            async with _BACKEND_REQUEST_SEMAPHORE:
+                await loop.run_in_executor(None, _do)
 
     async def _run_cmd(self, cmd, cwd=None, capture_stdout=False, ignore_errors=False):
         """Run a subprocess command asynchronously."""
@@ -1109,16 +1136,15 @@ class ClaudeCodeAdapter:
         
         try:
             # Transform status URL to point to parent session
-            from urllib.parse import urlparse as _up, urlunparse as _uu
-            p = _up(status_url)
+            p = urlparse(status_url)
             path_parts = [pt for pt in p.path.split('/') if pt]
             
             if 'projects' in path_parts and 'agentic-sessions' in path_parts:
                 proj_idx = path_parts.index('projects')
                 project = path_parts[proj_idx + 1] if len(path_parts) > proj_idx + 1 else ''
                 # Point to parent session's status
-                new_path = f"/api/projects/{project}/agentic-sessions/{session_name}"
-                url = _uu((p.scheme, p.netloc, new_path, '', '', ''))
+                new_path = _AGENTIC_SESSION_PATH_FMT.format(project=project, session=session_name)
+                url = urlunparse((p.scheme, p.netloc, new_path, '', '', ''))
                 logging.info(f"Fetching SDK session ID from: {url}")
             else:
                 logging.error("Could not parse project path from status URL")
@@ -1136,20 +1162,23 @@ class ClaudeCodeAdapter:
         def _do_req():
             try:
                 with _urllib_request.urlopen(req, timeout=15) as resp:
-                    return resp.read().decode('utf-8', errors='replace')
+                    return _json.load(resp)
             except _urllib_error.HTTPError as he:
                 logging.warning(f"SDK session ID fetch HTTP {he.code}")
-                return ''
+                return None
+            except _json.JSONDecodeError as e:
+                logging.error(f"Failed to parse SDK session ID: {e}")
+                return None
             except Exception as e:
                 logging.warning(f"SDK session ID fetch failed: {e}")
-                return ''
+                return None
         
-        resp_text = await loop.run_in_executor(None, _do_req)
-        if not resp_text:
+        async with _BACKEND_REQUEST_SEMAPHORE:
+            data = await loop.run_in_executor(None, _do_req)
+        if not data:
             return ""
         
         try:
-            data = _json.loads(resp_text)
             # Look for SDK session ID in annotations (persists across restarts)
             metadata = data.get('metadata', {})
             annotations = metadata.get('annotations', {})
@@ -1171,6 +1200,11 @@ class ClaudeCodeAdapter:
             return ""
 
     async def _fetch_github_token(self) -> str:
+        """Return GITHUB_TOKEN from env, or request a token from the backend.
+
+        Backend tokens are not cached here: the backend caches the GitHub mint
+        and may return tokens close to expiry, so each caller fetches its own.
+        """
         # Try cached value from env first
         cached = os.getenv("GITHUB_TOKEN", "").strip()
         if cached:
@@ -1184,14 +1218,13 @@ class ClaudeCodeAdapter:
             return ""
         
         try:
-            from urllib.parse import urlparse as _up, urlunparse as _uu
-            p = _up(status_url)
+            p = urlparse(status_url)
             new_path = p.path.rstrip("/")
             if new_path.endswith("/status"):
                 new_path = new_path[:-7] + "/github/token"
             else:
                 new_path = new_path + "/github/token"
-            url = _uu((p.scheme, p.netloc, new_path, '', '', ''))
+            url = urlunparse((p.scheme, p.netloc, new_path, '', '', ''))
             logging.info(f"Fetching GitHub token from: {url}")
         except Exception as e:
             logging.error(f"Failed to construct token URL: {e}")
@@ -1209,18 +1242,21 @@ class ClaudeCodeAdapter:
         def _do_req():
             try:
                 with _urllib_request.urlopen(req, timeout=10) as resp:
-                    return resp.read().decode('utf-8', errors='replace')
+                    return _json.load(resp)
+            except _json.JSONDecodeError as e:
+                logging.error(f"Failed to parse token response: {e}")
+                return None
             except Exception as e:
                 logging.warning(f"GitHub token fetch failed: {e}")
-                return ''
+                return None
         
-        resp_text = await loop.run_in_executor(None, _do_req)
-        if not resp_text:
+        async with _BACKEND_REQUEST_SEMAPHORE:
+            data = await loop.run_in_executor(None, _do_req)
+        if not data:
             logging.warning("Empty response from token endpoint")
             return ""
         
         try:
-            data = _json.loads(resp_text)
             token = str(data.get('token') or '')
             if token:
                 logging.info("Successfully fetched GitHub token from backend")
@@ -1300,8 +1336,7 @@ class ClaudeCodeAdapter:
                             derived = repo or ''
                             if not derived:
                                 # Fallback: last path segment without .git
-                                from urllib.parse import urlparse as _urlparse
-                                p = _urlparse(url)
+                                p = urlparse(url)
                                 parts = [p for p in (p.path or '').split('/') if p]
                                 if parts:
                                     derived = parts[-1]